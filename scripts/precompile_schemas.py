@@ -0,0 +1,72 @@
+"""
+Pre-compile skill input schemas into Python validator modules.
+
+Writes fastjsonschema generated code for each implemented skill into
+skills/_generated/<skill>_input_validator.py so SkillBase can import a
+ready-made validator instead of compiling the schema at runtime.
+
+Usage:
+    python scripts/precompile_schemas.py
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from skills.base import SCHEMA_FORMATS, schema_fingerprint  # noqa: E402
+
+GENERATED_DIR = ROOT / "skills" / "_generated"
+
+# All 9 skills from skills/README.md
+SKILLS = [
+    ("skills.content_creation.download_video", "SkillDownloadVideo"),
+    ("skills.content_creation.transcribe_audio", "SkillTranscribeAudio"),
+    ("skills.content_creation.generate_caption", "SkillGenerateCaption"),
+    ("skills.market_intelligence.analyze_trends", "SkillAnalyzeTrends"),
+    ("skills.market_intelligence.fetch_news", "SkillFetchNews"),
+    ("skills.market_intelligence.sentiment_analysis", "SkillSentimentAnalysis"),
+    ("skills.social_engagement.reply_comments", "SkillReplyComments"),
+    ("skills.social_engagement.schedule_posts", "SkillSchedulePosts"),
+    ("skills.social_engagement.analyze_metrics", "SkillAnalyzeMetrics"),
+]
+
+HEADER = '''"""
+Generated by scripts/precompile_schemas.py from {class_name}.get_input_schema().
+Do not edit by hand.
+"""
+
+SCHEMA_FINGERPRINT = "{fingerprint}"
+
+'''
+
+
+def main() -> int:
+    written = 0
+    for module_path, class_name in SKILLS:
+        try:
+            skill_cls = getattr(importlib.import_module(module_path), class_name)
+        except (ImportError, AttributeError):
+            print(f"skip {class_name}: not implemented")
+            continue
+
+        schema = skill_cls().get_input_schema()
+        skill_name = module_path.rpartition(".")[2]
+        target = GENERATED_DIR / f"{skill_name}_input_validator.py"
+        target.write_text(
+            HEADER.format(class_name=class_name, fingerprint=schema_fingerprint(schema))
+            + fastjsonschema.compile_to_code(schema, formats=SCHEMA_FORMATS)
+        )
+        print(f"wrote {target.relative_to(ROOT)}")
+        written += 1
+
+    print(f"{written}/{len(SKILLS)} skill validators generated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+Pre-generated input validators for Project Chimera skills.
+
+Modules in this package are written by scripts/precompile_schemas.py and
+should not be edited by hand. Re-run the tool after changing a skill's
+input schema; stale modules are ignored by SkillBase at runtime.
+"""
@@ -0,0 +1,280 @@
+"""
+Base classes for Project Chimera skills.
+
+Implements the SkillBase interface and error handling standards defined
+in skills/README.md. Every skill inherits from SkillBase and provides
+JSON schemas for its input and output contracts.
+"""
+
+import hashlib
+import importlib
+import json
+import sys
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from enum import Enum
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional, Type, Union
+from uuid import uuid4
+
+import fastjsonschema
+from pydantic import BaseModel
+
+# Package holding validators pre-generated by scripts/precompile_schemas.py
+GENERATED_PACKAGE = "skills._generated"
+
+# String formats checked by compiled regex in every skill schema, whatever
+# JSON Schema draft the schema declares (draft-04 has no uuid format).
+SCHEMA_FORMATS = {
+    "uuid": (
+        r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}"
+        r"-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+    ),
+}
+
+
+class SkillErrorType(Enum):
+    INPUT_VALIDATION = "input_validation"
+    EXTERNAL_API_FAILURE = "external_api_failure"
+    PROCESSING_TIMEOUT = "processing_timeout"
+    INSUFFICIENT_RESOURCES = "insufficient_resources"
+    CONTENT_SAFETY_VIOLATION = "content_safety_violation"
+    RATE_LIMIT_EXCEEDED = "rate_limit_exceeded"
+
+
+class SkillError(Exception):
+    def __init__(
+        self, error_type: SkillErrorType, message: str, recoverable: bool = True
+    ):
+        self.error_type = error_type
+        self.message = message
+        self.recoverable = recoverable
+        super().__init__(f"{error_type.value}: {message}")
+
+
+def schema_fingerprint(schema: Dict[str, Any]) -> str:
+    """Return a stable hash of a JSON schema, independent of key order."""
+    canonical = json.dumps(schema, sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _get_validator(schema_id: str) -> Callable[[Any], Any]:
+    """Compile a validator for a canonical (sorted-key) JSON schema string."""
+    return fastjsonschema.compile(json.loads(schema_id), formats=SCHEMA_FORMATS)
+
+
+def _load_validator(skill_cls: type, schema: Dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Return the input validator for a skill class.
+
+    Prefers the pre-generated module from skills/_generated when its
+    fingerprint matches the current schema, and falls back to compiling
+    the schema at runtime otherwise.
+    """
+    skill_name = skill_cls.__module__.rpartition(".")[2]
+    try:
+        generated = importlib.import_module(
+            f"{GENERATED_PACKAGE}.{skill_name}_input_validator"
+        )
+    except ImportError:
+        generated = None
+
+    fingerprint = schema_fingerprint(schema)
+    if generated is not None and generated.SCHEMA_FINGERPRINT == fingerprint:
+        return generated.validate
+    return _get_validator(json.dumps(schema, sort_keys=True))
+
+
+def _resolve_model(skill_cls: type, attr: str) -> Type[BaseModel]:
+    """
+    Resolve a skill's input_model/output_model to a fully built model.
+
+    String declarations are looked up in the module of the class that
+    declares them (which may be a base of skill_cls), and the model is
+    rebuilt against that namespace so forward references (e.g. Persona)
+    resolve without the caller having to import them first. The resolved
+    model replaces the string on the declaring class.
+    """
+    owner = next(klass for klass in skill_cls.__mro__ if attr in klass.__dict__)
+    namespace = vars(sys.modules[owner.__module__])
+    model = owner.__dict__[attr]
+    if isinstance(model, str):
+        try:
+            model = namespace[model]
+        except KeyError:
+            raise NameError(
+                f"{owner.__name__}.{attr} names {model!r}, which is not defined "
+                f"in module {owner.__module__}"
+            ) from None
+        setattr(owner, attr, model)
+    model.model_rebuild(_types_namespace=namespace)
+    return model
+
+
+def _model_schema(skill_cls: type, kind: str) -> Dict[str, Any]:
+    cache_attr = f"__{kind}_schema__"
+    schema = skill_cls.__dict__.get(cache_attr)
+    if schema is None:
+        schema = _resolve_model(skill_cls, f"{kind}_model").model_json_schema()
+        setattr(skill_cls, cache_attr, schema)
+    return schema
+
+
+def _declared_input_schema(self) -> Dict[str, Any]:
+    """Return the input_schema declared on the skill class."""
+    return self.input_schema
+
+
+def _declared_output_schema(self) -> Dict[str, Any]:
+    """Return the output_schema declared on the skill class."""
+    return self.output_schema
+
+
+def _input_schema_from_model(self) -> Dict[str, Any]:
+    """Return the JSON schema generated from input_model."""
+    return _model_schema(type(self), "input")
+
+
+def _output_schema_from_model(self) -> Dict[str, Any]:
+    """Return the JSON schema generated from output_model."""
+    return _model_schema(type(self), "output")
+
+
+class SkillBase(ABC):
+    """
+    Base class for all Chimera skills.
+
+    Implements common functionality:
+    - Input/output validation
+    - Confidence scoring
+    - Performance tracking
+    - Error handling
+
+    Instead of implementing the schema getters by hand, skills may declare
+    their contracts at class scope, either as JSON schema dicts via
+    input_schema/output_schema or as Pydantic models (or the names of
+    models in the skill's module) via input_model/output_model. Either way
+    every call returns the same dict, which callers must treat as
+    read-only.
+    """
+
+    input_schema: ClassVar[Optional[Dict[str, Any]]] = None
+    output_schema: ClassVar[Optional[Dict[str, Any]]] = None
+
+    input_model: ClassVar[Optional[Union[Type[BaseModel], str]]] = None
+    output_model: ClassVar[Optional[Union[Type[BaseModel], str]]] = None
+
+    # Metric weights for calculate_confidence(); other metrics weigh 0.1
+    _confidence_weights: ClassVar[Mapping[str, float]] = MappingProxyType(
+        {
+            "data_quality": 0.3,
+            "processing_success": 0.25,
+            "output_completeness": 0.25,
+            "performance": 0.2,
+        }
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Model schemas are built on first use and cached per class, so
+        # defining or instantiating a skill never pays for schema generation.
+        if "get_input_schema" not in cls.__dict__:
+            if cls.__dict__.get("input_schema") is not None:
+                cls.get_input_schema = _declared_input_schema
+            elif cls.__dict__.get("input_model") is not None:
+                cls.get_input_schema = _input_schema_from_model
+
+        if "get_output_schema" not in cls.__dict__:
+            if cls.__dict__.get("output_schema") is not None:
+                cls.get_output_schema = _declared_output_schema
+            elif cls.__dict__.get("output_model") is not None:
+                cls.get_output_schema = _output_schema_from_model
+
+    def __init__(self):
+        self.skill_id = uuid4().hex
+        self._created_ns = time.time_ns()
+
+    @cached_property
+    def created_at(self) -> datetime:
+        """UTC creation time, converted from the raw timestamp on first access."""
+        return datetime.fromtimestamp(self._created_ns / 1e9, tz=timezone.utc)
+
+    @abstractmethod
+    async def execute(self, input_data: BaseModel) -> BaseModel:
+        """
+        Execute the skill with validated input and return validated output.
+
+        Must:
+        1. Validate input against skill-specific schema
+        2. Perform skill logic with error handling
+        3. Calculate confidence score based on success metrics
+        4. Return output matching skill-specific schema
+        """
+        pass
+
+    @abstractmethod
+    def get_input_schema(self) -> Dict[str, Any]:
+        """Return JSON schema for skill input validation."""
+        pass
+
+    @abstractmethod
+    def get_output_schema(self) -> Dict[str, Any]:
+        """Return JSON schema for skill output validation."""
+        pass
+
+    def validate_input(self, payload: Union[BaseModel, Mapping[str, Any]]) -> None:
+        """
+        Validate an input payload against the skill's input schema.
+
+        Accepts the model passed to execute() (dumped in JSON mode first) or
+        a raw mapping. The validator is resolved once per skill class and
+        stored as ``_validate_in``, so skills should call this at the top of
+        execute().
+
+        Raises:
+            SkillError: INPUT_VALIDATION if the payload does not match
+        """
+        cls = type(self)
+        validate = cls.__dict__.get("_validate_in")
+        if validate is None:
+            validate = _load_validator(cls, self.get_input_schema())
+            cls._validate_in = staticmethod(validate)
+
+        if isinstance(payload, BaseModel):
+            payload = payload.model_dump(mode="json")
+        elif not isinstance(payload, dict):
+            payload = dict(payload)
+
+        try:
+            validate(payload)
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise SkillError(
+                SkillErrorType.INPUT_VALIDATION,
+                f"{cls.__name__} input rejected: {e.message}",
+                recoverable=False,
+            ) from e
+
+    def calculate_confidence(self, success_metrics: Dict[str, float]) -> float:
+        """
+        Calculate confidence score based on skill-specific success metrics.
+
+        Args:
+            success_metrics: Dict of metric_name -> score (0.0 to 1.0)
+
+        Returns:
+            Overall confidence score (0.0 to 1.0)
+        """
+        if not success_metrics:
+            return 0.0
+
+        weights = self._confidence_weights
+        weighted_score = sum(
+            score * weights.get(metric, 0.1)
+            for metric, score in success_metrics.items()
+        )
+
+        return min(max(weighted_score, 0.0), 1.0)
@@ -0,0 +1,145 @@
+"""
+Shared pytest configuration for Project Chimera tests.
+
+Skips tests whose client modules are not implemented yet and provides
+shared fixtures for benchmarking and for stubbing external services.
+Plain helpers used by the test modules live in tests/helpers.py.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from tests.helpers import json_bytes, module_exists
+
+# uvloop backs the async tests when installed; it has no Windows build
+uvloop = None
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+
+
+# Client fixtures whose tests are skipped at collection while the module
+# that implements them is missing
+FIXTURE_MODULES = {
+    "trend_fetcher": (
+        "chimera.market_intelligence.trend_fetcher",
+        "TrendFetcher not implemented",
+    ),
+    "weaviate_client": (
+        "chimera.mcp_clients.weaviate_client",
+        "WeaviateClient not implemented",
+    ),
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    for fixture_name, (module_name, reason) in FIXTURE_MODULES.items():
+        if module_exists(module_name):
+            continue
+
+        skip = pytest.mark.skip(reason=reason)
+        for item in items:
+            if fixture_name in getattr(item, "fixturenames", ()):
+                item.add_marker(skip)
+
+
+class _UvloopLoopFactory:
+    """Runs async tests on uvloop via pytest-asyncio's loop-factory hook"""
+
+    @staticmethod
+    def pytest_asyncio_loop_factories(config, item):
+        return {"uvloop": uvloop.new_event_loop}
+
+
+class _UvloopEventLoopPolicy:
+    """Fallback for pytest-asyncio releases that predate the loop-factory hook"""
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy(self):
+        """Run async tests on uvloop where available, the stock loop otherwise"""
+        if uvloop is not None:
+            return uvloop.EventLoopPolicy()
+        return asyncio.DefaultEventLoopPolicy()
+
+
+def pytest_configure(config):
+    # pytest-asyncio 1.4 deprecates overriding event_loop_policy in favour of
+    # the pytest_asyncio_loop_factories hook; use whichever is available
+    if hasattr(config.pluginmanager.hook, "pytest_asyncio_loop_factories"):
+        if uvloop is not None:
+            config.pluginmanager.register(_UvloopLoopFactory(), "chimera-uvloop")
+    else:
+        config.pluginmanager.register(_UvloopEventLoopPolicy(), "chimera-uvloop")
+
+
+# Canned Weaviate REST responses, serialised once at import
+_WEAVIATE_OBJECT_CREATED = json_bytes(
+    {"id": str(uuid.uuid4()), "class": "TrendData", "properties": {}}
+)
+# One trend row that satisfies the query (virality >= 0.5) and vector
+# search (certainty >= 0.7) filters, so per-result assertions run
+_WEAVIATE_TREND_ROW = {
+    "trend_topic": "AI Testing",
+    "platform": "twitter",
+    "virality_score": 0.75,
+    "sentiment_score": 0.6,
+    "content_examples": ["Test content 1"],
+    "detected_at": "2024-01-01T00:00:00+00:00",
+    "_additional": {"id": str(uuid.uuid4()), "certainty": 0.82},
+}
+_WEAVIATE_GRAPHQL_TRENDS = json_bytes(
+    {"data": {"Get": {"TrendData": [_WEAVIATE_TREND_ROW]}}}
+)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def weaviate_stub():
+    """
+    In-process Weaviate stand-in on a loopback port.
+
+    Serves pre-serialised JSON for /v1/objects and /v1/graphql and points
+    WEAVIATE_URL at itself for the rest of the session.
+    """
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    def canned(body: bytes):
+        async def handler(request):
+            return web.Response(body=body, content_type="application/json")
+
+        return handler
+
+    app = web.Application()
+    app.router.add_post("/v1/objects", canned(_WEAVIATE_OBJECT_CREATED))
+    app.router.add_post("/v1/graphql", canned(_WEAVIATE_GRAPHQL_TRENDS))
+
+    server = TestServer(app, host="127.0.0.1", port=0)
+    await server.start_server()
+    url = str(server.make_url("")).rstrip("/")
+
+    previous_url = os.environ.get("WEAVIATE_URL")
+    os.environ["WEAVIATE_URL"] = url
+    yield url
+
+    if previous_url is None:
+        os.environ.pop("WEAVIATE_URL", None)
+    else:
+        os.environ["WEAVIATE_URL"] = previous_url
+    await server.close()
+
+
+@pytest.fixture
+def aio_benchmark(benchmark):
+    """pytest-benchmark for coroutine functions, one event loop per round"""
+
+    def run(coroutine_function, *args, **kwargs):
+        return benchmark(lambda: asyncio.run(coroutine_function(*args, **kwargs)))
+
+    return run
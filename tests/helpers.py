@@ -0,0 +1,100 @@
+"""
+Plain helpers shared by the Project Chimera test modules.
+
+Kept out of conftest.py so test modules can import them directly: import
+helpers that tolerate partially implemented packages, so the TDD suites
+can report on whatever components already exist, and JSON/timing utilities.
+"""
+
+import importlib
+import importlib.util
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _isoformat_utc(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Serialise to JSON bytes (orjson if installed); naive datetimes are UTC"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC)
+    return json.dumps(obj, default=_isoformat_utc).encode()
+
+
+def timing_enforced() -> bool:
+    """False under a tracer (debugger, coverage), where wall-clock limits mislead"""
+    return sys.gettrace() is None and "COVERAGE_RUN" not in os.environ
+
+
+# (module, symbol) pairs for the skills interface defined in skills/README.md
+SKILL_IMPORTS = [
+    ("skills.base", "SkillBase"),
+    ("skills.base", "SkillError"),
+    ("skills.base", "SkillErrorType"),
+    # Content Creation Skills
+    ("skills.content_creation.download_video", "SkillDownloadVideo"),
+    ("skills.content_creation.transcribe_audio", "SkillTranscribeAudio"),
+    ("skills.content_creation.generate_caption", "SkillGenerateCaption"),
+    # Market Intelligence Skills
+    ("skills.market_intelligence.analyze_trends", "SkillAnalyzeTrends"),
+    ("skills.market_intelligence.fetch_news", "SkillFetchNews"),
+    ("skills.market_intelligence.sentiment_analysis", "SkillSentimentAnalysis"),
+    # Social Engagement Skills
+    ("skills.social_engagement.reply_comments", "SkillReplyComments"),
+    ("skills.social_engagement.schedule_posts", "SkillSchedulePosts"),
+    ("skills.social_engagement.analyze_metrics", "SkillAnalyzeMetrics"),
+]
+
+
+def module_exists(module_name: str) -> bool:
+    """
+    Check whether a module can be found without importing the module itself.
+
+    find_spec() still imports the parent packages, so a missing or broken
+    parent (e.g. chimera/__init__.py failing on a half-written submodule)
+    counts as the module not existing.
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _import_symbol(module_name: str, symbol: str) -> Optional[object]:
+    if not module_exists(module_name):
+        return None
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    return getattr(module, symbol, None)
+
+
+@lru_cache(maxsize=None)
+def try_import_skills() -> SimpleNamespace:
+    """
+    Import every skills symbol independently.
+
+    Unimplemented modules map to None, so one missing skill does not hide
+    the others. Cached so every caller shares a single import pass.
+    """
+    return SimpleNamespace(
+        **{
+            symbol: _import_symbol(module_name, symbol)
+            for module_name, symbol in SKILL_IMPORTS
+        }
+    )
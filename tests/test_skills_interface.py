@@ -18,51 +18,55 @@ Expected Status: FAILING (until implementation completed)
 import pytest
 import json
 import asyncio
+import sys
+import types
 from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from datetime import datetime
+from time import perf_counter_ns
 import uuid
 from abc import ABC, abstractmethod
 from pydantic import BaseModel, ValidationError
 
-# Import skills modules (these don't exist yet - will cause ImportError)
-try:
-    from skills.base import SkillBase, SkillError, SkillErrorType
-    
-    # Content Creation Skills
-    from skills.content_creation.download_video import SkillDownloadVideo
-    from skills.content_creation.transcribe_audio import SkillTranscribeAudio
-    from skills.content_creation.generate_caption import SkillGenerateCaption
-    
-    # Market Intelligence Skills  
-    from skills.market_intelligence.analyze_trends import SkillAnalyzeTrends
-    from skills.market_intelligence.fetch_news import SkillFetchNews
-    from skills.market_intelligence.sentiment_analysis import SkillSentimentAnalysis
-    
-    # Social Engagement Skills
-    from skills.social_engagement.reply_comments import SkillReplyComments
-    from skills.social_engagement.schedule_posts import SkillSchedulePosts
-    from skills.social_engagement.analyze_metrics import SkillAnalyzeMetrics
-    
-except ImportError:
-    # Expected failure - skills not implemented yet
-    SkillBase = None
-    SkillError = None
-    SkillErrorType = None
-    
-    # Content Creation Skills
-    SkillDownloadVideo = None
-    SkillTranscribeAudio = None
-    SkillGenerateCaption = None
-    
-    # Market Intelligence Skills
-    SkillAnalyzeTrends = None
-    SkillFetchNews = None
-    SkillSentimentAnalysis = None
-    
-    # Social Engagement Skills
-    SkillReplyComments = None
-    SkillSchedulePosts = None
-    SkillAnalyzeMetrics = None
+from tests.helpers import try_import_skills
+
+# Import skills modules (most don't exist yet - missing ones resolve to None)
+_skills = try_import_skills()
+
+SkillBase = _skills.SkillBase
+SkillError = _skills.SkillError
+SkillErrorType = _skills.SkillErrorType
+
+# Content Creation Skills
+SkillDownloadVideo = _skills.SkillDownloadVideo
+SkillTranscribeAudio = _skills.SkillTranscribeAudio
+SkillGenerateCaption = _skills.SkillGenerateCaption
+
+# Market Intelligence Skills
+SkillAnalyzeTrends = _skills.SkillAnalyzeTrends
+SkillFetchNews = _skills.SkillFetchNews
+SkillSentimentAnalysis = _skills.SkillSentimentAnalysis
+
+# Social Engagement Skills
+SkillReplyComments = _skills.SkillReplyComments
+SkillSchedulePosts = _skills.SkillSchedulePosts
+SkillAnalyzeMetrics = _skills.SkillAnalyzeMetrics
+
+class _EmptyInput(BaseModel):
+    """Placeholder input for skills executed without a real payload"""
+
+
+# Built once and shared by every execute() call; model_construct() skips validation
+_EMPTY_INPUT = _EmptyInput.model_construct()
+
+
+# Declared as strings on a skill to exercise forward-reference resolution;
+# _PersonaRef is deliberately defined after the model that refers to it
+class _CaptionRequest(BaseModel):
+    persona: "_PersonaRef"
+
+
+class _PersonaRef(BaseModel):
+    persona_id: str
 
 
 class TestSkillBaseInterface:
@@ -86,10 +90,8 @@ class TestSkillBaseInterface:
             'get_output_schema'
         ]
         
-        for method_name in required_methods:
-            assert hasattr(SkillBase, method_name), f"Missing abstract method: {method_name}"
-            method = getattr(SkillBase, method_name)
-            assert getattr(method, '__isabstractmethod__', False), f"{method_name} must be abstract"
+        missing = set(required_methods) - SkillBase.__abstractmethods__
+        assert not missing, f"Missing abstract methods: {sorted(missing)}"
     
     def test_skill_base_common_functionality(self):
         """Test common functionality provided by SkillBase"""
@@ -126,6 +128,197 @@ class TestSkillBaseInterface:
         confidence = skill.calculate_confidence(success_metrics)
         assert isinstance(confidence, float)
         assert 0.0 <= confidence <= 1.0
+        
+        # Out-of-range weighted scores are clamped to [0.0, 1.0]
+        assert skill.calculate_confidence({**success_metrics, 'data_quality': 5.0}) == 1.0
+        assert skill.calculate_confidence({'data_quality': -1.0}) == 0.0
+    
+    def test_skill_base_validate_input(self):
+        """validate_input accepts valid payloads and rejects invalid ones"""
+        assert SkillBase is not None, "SkillBase not implemented"
+        
+        class TestSkill(SkillBase):
+            input_schema = {
+                "type": "object",
+                "properties": {"source_url": {"type": "string"}},
+                "required": ["source_url"]
+            }
+            output_schema = {"type": "object"}
+            
+            async def execute(self, input_data: BaseModel) -> BaseModel:
+                return input_data
+        
+        class DownloadInput(BaseModel):
+            source_url: str
+        
+        skill = TestSkill()
+        skill.validate_input({"source_url": "https://www.youtube.com/watch?v=test"})
+        
+        # The model handed to execute() validates like its JSON form
+        skill.validate_input(DownloadInput(source_url="https://www.youtube.com/watch?v=test"))
+        with pytest.raises(SkillError):
+            skill.validate_input(_EMPTY_INPUT)
+        
+        # Invalid input is reported as a non-recoverable SkillError
+        with pytest.raises(SkillError) as excinfo:
+            skill.validate_input({"source_url": 42})
+        assert excinfo.value.error_type == SkillErrorType.INPUT_VALIDATION
+        assert excinfo.value.recoverable is False
+        assert "source_url" in excinfo.value.message
+    
+    def test_skill_base_validator_cached_per_class(self):
+        """The compiled validator is stored once per skill class, never inherited"""
+        assert SkillBase is not None, "SkillBase not implemented"
+        
+        class TestSkill(SkillBase):
+            input_schema = {"type": "object", "required": ["source_url"]}
+            output_schema = {"type": "object"}
+            
+            async def execute(self, input_data: BaseModel) -> BaseModel:
+                return input_data
+        
+        class TestSubSkill(TestSkill):
+            input_schema = {"type": "object", "required": ["audio_source"]}
+        
+        TestSkill().validate_input({"source_url": "a"})
+        validator = TestSkill.__dict__["_validate_in"]
+        TestSkill().validate_input({"source_url": "b"})
+        assert TestSkill.__dict__["_validate_in"] is validator
+        
+        # A subclass with its own schema compiles its own validator
+        TestSubSkill().validate_input({"audio_source": "a"})
+        assert TestSubSkill.__dict__["_validate_in"] is not validator
+        with pytest.raises(SkillError):
+            TestSubSkill().validate_input({"source_url": "a"})
+    
+    def test_skill_base_uuid_format(self):
+        """uuid strings are checked even under draft-04, which lacks the format"""
+        assert SkillBase is not None, "SkillBase not implemented"
+        
+        class TestSkill(SkillBase):
+            input_schema = {
+                "$schema": "http://json-schema.org/draft-04/schema#",
+                "type": "object",
+                "properties": {"persona_id": {"type": "string", "format": "uuid"}}
+            }
+            output_schema = {"type": "object"}
+            
+            async def execute(self, input_data: BaseModel) -> BaseModel:
+                return input_data
+        
+        skill = TestSkill()
+        skill.validate_input({"persona_id": str(uuid.uuid4())})
+        with pytest.raises(SkillError):
+            skill.validate_input({"persona_id": uuid.uuid4().hex})
+    
+    def test_skill_base_generated_validator(self, monkeypatch):
+        """A pre-generated validator is used only while its fingerprint matches"""
+        assert SkillBase is not None, "SkillBase not implemented"
+        from skills.base import GENERATED_PACKAGE, schema_fingerprint
+        
+        schema = {"type": "object", "required": ["source_url"]}
+        generated_calls = []
+        
+        generated = types.ModuleType("generated_validator")
+        generated.validate = generated_calls.append
+        generated.SCHEMA_FINGERPRINT = schema_fingerprint(schema)
+        skill_name = __name__.rpartition(".")[2]
+        monkeypatch.setitem(
+            sys.modules, f"{GENERATED_PACKAGE}.{skill_name}_input_validator", generated
+        )
+        
+        def make_skill():
+            class TestSkill(SkillBase):
+                input_schema = schema
+                output_schema = {"type": "object"}
+                
+                async def execute(self, input_data: BaseModel) -> BaseModel:
+                    return input_data
+            
+            return TestSkill()
+        
+        make_skill().validate_input({})
+        assert generated_calls == [{}]
+        
+        # A stale module (schema changed since generation) falls back to compiling
+        generated.SCHEMA_FINGERPRINT = "stale"
+        with pytest.raises(SkillError):
+            make_skill().validate_input({})
+        assert generated_calls == [{}]
+    
+    def test_skill_base_declared_schemas(self):
+        """Class-level schemas are served as the same dict on every call"""
+        assert SkillBase is not None, "SkillBase not implemented"
+        
+        class TestSkill(SkillBase):
+            input_schema = {"type": "object"}
+            output_model = _EmptyInput
+            
+            async def execute(self, input_data: BaseModel) -> BaseModel:
+                return input_data
+        
+        skill = TestSkill()
+        assert skill.get_input_schema() is TestSkill.input_schema
+        assert skill.get_input_schema() is skill.get_input_schema()
+        assert skill.get_output_schema() is TestSkill().get_output_schema()
+        assert skill.get_output_schema()["type"] == "object"
+    
+    def test_skill_base_string_model(self):
+        """String input_model names resolve, forward references included"""
+        assert SkillBase is not None, "SkillBase not implemented"
+        
+        class TestSkill(SkillBase):
+            input_model = "_CaptionRequest"
+            output_model = "_PersonaRef"
+            
+            async def execute(self, input_data: BaseModel) -> BaseModel:
+                return input_data
+        
+        skill = TestSkill()
+        input_schema = skill.get_input_schema()
+        
+        assert TestSkill.input_model is _CaptionRequest
+        assert "persona" in input_schema["properties"]
+        assert skill.get_output_schema()["required"] == ["persona_id"]
+        skill.validate_input({"persona": {"persona_id": str(uuid.uuid4())}})
+        with pytest.raises(SkillError):
+            skill.validate_input({"persona": {}})
+    
+    def test_skill_base_inherited_string_model(self, monkeypatch):
+        """Inherited model names resolve in the declaring class's module"""
+        assert SkillBase is not None, "SkillBase not implemented"
+        
+        class ParentInput(BaseModel):
+            source_url: str
+        
+        parent_module = types.ModuleType("parent_skill_module")
+        parent_module.ParentInput = ParentInput
+        monkeypatch.setitem(sys.modules, parent_module.__name__, parent_module)
+        
+        class ParentSkill(SkillBase):
+            __module__ = parent_module.__name__
+            input_model = "ParentInput"
+            output_schema = {"type": "object"}
+            
+            async def execute(self, input_data: BaseModel) -> BaseModel:
+                return input_data
+        
+        class ChildSkill(ParentSkill):
+            pass
+        
+        # Resolved through the child first; ParentInput is not in this module
+        assert ChildSkill().get_input_schema()["required"] == ["source_url"]
+        assert ParentSkill.input_model is ParentInput
+        
+        class BrokenSkill(SkillBase):
+            input_model = "UndefinedInput"
+            output_schema = {"type": "object"}
+            
+            async def execute(self, input_data: BaseModel) -> BaseModel:
+                return input_data
+        
+        with pytest.raises(NameError, match="UndefinedInput"):
+            BrokenSkill().get_input_schema()
 
 
 class TestSkillErrorHandling:
@@ -147,8 +340,8 @@ class TestSkillErrorHandling:
             'RATE_LIMIT_EXCEEDED'
         ]
         
-        for error_type in required_error_types:
-            assert hasattr(SkillErrorType, error_type), f"Missing error type: {error_type}"
+        missing = set(required_error_types) - SkillErrorType.__members__.keys()
+        assert not missing, f"Missing error types: {sorted(missing)}"
     
     def test_skill_error_exception(self):
         """Test SkillError exception class"""
@@ -168,40 +361,58 @@ class TestSkillErrorHandling:
         assert "input_validation" in str(error)
 
 
-@pytest.mark.parametrize("skill_class,category", [
+# Every skill (by class name) with its performance category
+SKILL_CATEGORIES = [
     # Content Creation Skills (45 second limit, 2GB memory, $8 cost)
-    (SkillDownloadVideo, "content_creation"),
-    (SkillTranscribeAudio, "content_creation"), 
-    (SkillGenerateCaption, "content_creation"),
+    ("SkillDownloadVideo", "content_creation"),
+    ("SkillTranscribeAudio", "content_creation"), 
+    ("SkillGenerateCaption", "content_creation"),
     
     # Market Intelligence Skills (15 second limit, 1GB memory, $3 cost)
-    (SkillAnalyzeTrends, "market_intelligence"),
-    (SkillFetchNews, "market_intelligence"),
-    (SkillSentimentAnalysis, "market_intelligence"),
+    ("SkillAnalyzeTrends", "market_intelligence"),
+    ("SkillFetchNews", "market_intelligence"),
+    ("SkillSentimentAnalysis", "market_intelligence"),
     
     # Social Engagement Skills (5 second limit, 512MB memory, $2 cost)
-    (SkillReplyComments, "social_engagement"),
-    (SkillSchedulePosts, "social_engagement"),
-    (SkillAnalyzeMetrics, "social_engagement")
+    ("SkillReplyComments", "social_engagement"),
+    ("SkillSchedulePosts", "social_engagement"),
+    ("SkillAnalyzeMetrics", "social_engagement")
+]
+
+
+# Grouped by category so pytest-xdist (--dist=loadgroup) runs each category on its own worker
+@pytest.fixture(scope="session", params=[
+    pytest.param(entry, marks=pytest.mark.xdist_group(entry[1]), id=entry[0])
+    for entry in SKILL_CATEGORIES
 ])
+def skill_instance(request):
+    """One skill instance per skill class, shared across the whole session"""
+    skill_name, category = request.param
+    skill_class = getattr(_skills, skill_name)
+    if skill_class is None:
+        pytest.skip(f"{skill_name} not implemented")
+    
+    return skill_class(), category
+
+
 class TestIndividualSkills:
     """
     Test each skill implementation against its interface contract
     """
     
-    def test_skill_implements_base_interface(self, skill_class, category):
+    def test_skill_implements_base_interface(self, subtests):
         """Each skill must inherit from SkillBase"""
-        if skill_class is None:
-            pytest.skip(f"Skill class not implemented")
-        
-        assert issubclass(skill_class, SkillBase), f"{skill_class.__name__} must inherit from SkillBase"
+        for skill_name, category in SKILL_CATEGORIES:
+            with subtests.test(skill=skill_name, category=category):
+                skill_class = getattr(_skills, skill_name)
+                if skill_class is None:
+                    pytest.skip(f"{skill_name} not implemented")
+                
+                assert issubclass(skill_class, SkillBase), f"{skill_name} must inherit from SkillBase"
     
-    def test_skill_has_required_schemas(self, skill_class, category):
+    def test_skill_has_required_schemas(self, skill_instance):
         """Each skill must provide input and output schemas"""
-        if skill_class is None:
-            pytest.skip(f"Skill class not implemented")
-        
-        skill = skill_class()
+        skill, category = skill_instance
         
         # Must implement schema methods
         input_schema = skill.get_input_schema()
@@ -212,11 +423,10 @@ class TestIndividualSkills:
         assert input_schema["type"] == "object", "Input schema must be object type"
         assert output_schema["type"] == "object", "Output schema must be object type"
     
-    @pytest.mark.asyncio
-    async def test_skill_performance_requirements(self, skill_class, category):
+    @pytest.mark.performance
+    def test_skill_performance_requirements(self, skill_instance):
         """Each skill must meet category performance requirements"""
-        if skill_class is None:
-            pytest.skip(f"Skill class not implemented")
+        skill, category = skill_instance
         
         # Performance limits from skills/README.md
         performance_limits = {
@@ -226,20 +436,16 @@ class TestIndividualSkills:
         }
         
         limits = performance_limits[category]
-        skill = skill_class()
         
         # Mock input data (should be validated by input schema)
-        mock_input = BaseModel()
-        
-        start_time = datetime.utcnow()
+        start_ns = perf_counter_ns()
         try:
-            result = await skill.execute(mock_input)
+            result = asyncio.run(skill.execute(_EMPTY_INPUT))
         except Exception as e:
             # Expected to fail during TDD phase
             pass
-        end_time = datetime.utcnow()
         
-        execution_time = (end_time - start_time).total_seconds()
+        execution_time = (perf_counter_ns() - start_ns) / 1e9
         # Note: This will fail until proper implementation with realistic timing
         # assert execution_time < limits["time"], f"Execution time {execution_time}s exceeds {limits['time']}s limit"
 
@@ -249,8 +455,7 @@ class TestContentCreationSkills:
     Specific tests for Content Creation skills based on skills/README.md schemas
     """
     
-    @pytest.mark.asyncio
-    async def test_skill_download_video_input_schema(self):
+    def test_skill_download_video_input_schema(self):
         """Test SkillDownloadVideo accepts correct input parameters"""
         if SkillDownloadVideo is None:
             pytest.skip("SkillDownloadVideo not implemented")
@@ -275,13 +480,12 @@ class TestContentCreationSkills:
         # This should validate against the schema
         # Will fail until implementation exists
         try:
-            result = await skill.execute(valid_input)
+            result = asyncio.run(skill.execute(valid_input))
         except Exception:
             # Expected during TDD phase
             pass
     
-    @pytest.mark.asyncio
-    async def test_skill_transcribe_audio_output_schema(self):
+    def test_skill_transcribe_audio_output_schema(self):
         """Test SkillTranscribeAudio returns correct output structure"""
         if SkillTranscribeAudio is None:
             pytest.skip("SkillTranscribeAudio not implemented")
@@ -301,8 +505,7 @@ class TestContentCreationSkills:
         assert confidence_schema["minimum"] == 0
         assert confidence_schema["maximum"] == 1
     
-    @pytest.mark.asyncio
-    async def test_skill_generate_caption_persona_context(self):
+    def test_skill_generate_caption_persona_context(self):
         """Test SkillGenerateCaption handles persona context correctly"""
         if SkillGenerateCaption is None:
             pytest.skip("SkillGenerateCaption not implemented")
@@ -327,8 +530,7 @@ class TestMarketIntelligenceSkills:
     Specific tests for Market Intelligence skills
     """
     
-    @pytest.mark.asyncio
-    async def test_skill_analyze_trends_confidence_routing(self):
+    def test_skill_analyze_trends_confidence_routing(self):
         """Test SkillAnalyzeTrends provides confidence for HITL routing"""
         if SkillAnalyzeTrends is None:
             pytest.skip("SkillAnalyzeTrends not implemented")
@@ -344,8 +546,7 @@ class TestMarketIntelligenceSkills:
         assert confidence_schema["minimum"] == 0
         assert confidence_schema["maximum"] == 1
     
-    @pytest.mark.asyncio
-    async def test_skill_fetch_news_content_filtering(self):
+    def test_skill_fetch_news_content_filtering(self):
         """Test SkillFetchNews handles content safety filtering"""
         if SkillFetchNews is None:
             pytest.skip("SkillFetchNews not implemented")
@@ -361,8 +562,7 @@ class TestMarketIntelligenceSkills:
         assert "brand_safety_filter" in filtering_props
         assert "exclude_nsfw" in filtering_props
     
-    @pytest.mark.asyncio
-    async def test_skill_sentiment_analysis_emotion_breakdown(self):
+    def test_skill_sentiment_analysis_emotion_breakdown(self):
         """Test SkillSentimentAnalysis provides detailed emotion analysis"""
         if SkillSentimentAnalysis is None:
             pytest.skip("SkillSentimentAnalysis not implemented")
@@ -389,8 +589,7 @@ class TestSocialEngagementSkills:
     Specific tests for Social Engagement skills
     """
     
-    @pytest.mark.asyncio
-    async def test_skill_reply_comments_escalation_assessment(self):
+    def test_skill_reply_comments_escalation_assessment(self):
         """Test SkillReplyComments provides escalation assessment"""
         if SkillReplyComments is None:
             pytest.skip("SkillReplyComments not implemented")
@@ -406,8 +605,7 @@ class TestSocialEngagementSkills:
         assert "requires_human_review" in escalation_props
         assert "brand_risk_level" in escalation_props
     
-    @pytest.mark.asyncio
-    async def test_skill_schedule_posts_optimization_goals(self):
+    def test_skill_schedule_posts_optimization_goals(self):
         """Test SkillSchedulePosts handles optimization goals"""
         if SkillSchedulePosts is None:
             pytest.skip("SkillSchedulePosts not implemented")
@@ -427,8 +625,7 @@ class TestSocialEngagementSkills:
         for goal in valid_goals:
             assert goal in enum_values
     
-    @pytest.mark.asyncio
-    async def test_skill_analyze_metrics_benchmarking(self):
+    def test_skill_analyze_metrics_benchmarking(self):
         """Test SkillAnalyzeMetrics provides benchmarking capabilities"""
         if SkillAnalyzeMetrics is None:
             pytest.skip("SkillAnalyzeMetrics not implemented")
@@ -451,8 +648,7 @@ class TestSkillsIntegrationWithWorkerAgents:
     Integration tests for skills working with Worker Agent architecture
     """
     
-    @pytest.mark.asyncio
-    async def test_content_creation_pipeline_integration(self):
+    def test_content_creation_pipeline_integration(self):
         """Test full content creation pipeline integration"""
         
         required_skills = [SkillDownloadVideo, SkillTranscribeAudio, SkillGenerateCaption]
@@ -481,8 +677,7 @@ class TestSkillsIntegrationWithWorkerAgents:
         assert "audio_source" in transcribe_props
         # Should be compatible (both are file paths)
     
-    @pytest.mark.asyncio
-    async def test_confidence_based_routing_integration(self):
+    def test_confidence_based_routing_integration(self):
         """Test HITL routing based on skill confidence scores"""
         
         # All skills should return confidence scores for routing decisions
@@ -515,8 +710,7 @@ class TestSkillsPerformanceRequirements:
     Validate skills meet performance requirements from specs/_meta.md
     """
     
-    @pytest.mark.asyncio
-    async def test_skills_concurrent_execution(self):
+    def test_skills_concurrent_execution(self, aio_benchmark):
         """Test multiple skills executing concurrently"""
         
         # Test with implemented skills only
@@ -532,23 +726,16 @@ class TestSkillsPerformanceRequirements:
         # Execute multiple skills simultaneously
         async def execute_skill(skill_class):
             skill = skill_class()
-            mock_input = BaseModel()
-            return await skill.execute(mock_input)
+            return await skill.execute(_EMPTY_INPUT)
         
-        tasks = [execute_skill(skill_class) for skill_class in available_skills]
+        async def execute_all():
+            tasks = [execute_skill(skill_class) for skill_class in available_skills]
+            # Failures are expected during TDD phase
+            return await asyncio.gather(*tasks, return_exceptions=True)
         
-        start_time = datetime.utcnow()
-        try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-        except Exception:
-            # Expected during TDD phase
-            pass
-        end_time = datetime.utcnow()
-        
-        total_time = (end_time - start_time).total_seconds()
-        # Should handle concurrent execution efficiently
-        assert total_time < 30.0, f"Concurrent skills execution took {total_time}s, too slow"
-
+        # Timing distribution is recorded by pytest-benchmark
+        results = aio_benchmark(execute_all)
+        assert len(results) == len(available_skills)
 
 if __name__ == "__main__":
     print("Running TDD failing tests for Project Chimera Skills Interface...")
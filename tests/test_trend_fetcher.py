@@ -15,24 +15,85 @@ Expected Status: FAILING (until implementation completed)
 """
 
 import pytest
+import pytest_asyncio
 import json
 import asyncio
+import time
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 import uuid
+from types import MappingProxyType
 
-# Import specifications (these modules don't exist yet - will cause ImportError)
-try:
-    from chimera.market_intelligence.trend_fetcher import TrendFetcher
+from tests.helpers import json_bytes, module_exists, timing_enforced
+
+# Probe for the implementations without importing them (these modules don't
+# exist yet); the real imports happen lazily inside the tests and fixtures.
+# Client-backed tests are skipped at collection by conftest instead.
+_HAS_TREND = module_exists("chimera.market_intelligence.trend_fetcher")
+_HAS_TREND_DATA = module_exists("chimera.models.trend_data")
+
+# Shared detection timestamp for schema tests that don't depend on freshness
+_NOW = datetime.utcnow()
+
+# Trend record for Weaviate storage tests, plus its JSON body serialised once
+_TREND_RECORD = {
+    "trend_topic": "AI Testing",
+    "platform": "twitter",
+    "virality_score": 0.75,
+    "sentiment_score": 0.6,
+    "content_examples": ["Test content 1", "Test content 2"],
+    "detected_at": _NOW
+}
+_TREND_PAYLOAD = json_bytes(_TREND_RECORD)
+
+# Canonical analyze_market_trends inputs as read-only mappings. Values are
+# lists to match the spec's array type; tests must not mutate them
+_INPUT_24H = MappingProxyType({
+    "keywords": ["AI", "influencer", "content"],
+    "platforms": ["twitter", "instagram"],
+    "time_range": "24h"
+})
+_INPUT_1H = MappingProxyType({
+    "keywords": ["test"],
+    "platforms": ["twitter"],
+    "time_range": "1h"
+})
+_INPUT_PERFORMANCE = MappingProxyType({
+    "keywords": ["performance", "test"],
+    "platforms": ["twitter"],
+    "time_range": "1h"
+})
+_INPUT_CONFIDENCE = MappingProxyType({
+    "keywords": ["confidence", "test"],
+    "platforms": ["twitter"],
+    "time_range": "6h"
+})
+
+
+def _trend_data_model():
+    """TrendData model class, imported on first use"""
+    # This SHOULD FAIL - TrendData not implemented (a test failure, not a
+    # setup error, which is why this is a helper rather than a fixture)
+    if not _HAS_TREND_DATA:
+        pytest.fail("TrendData model not implemented")
     from chimera.models.trend_data import TrendData
-    from chimera.mcp_clients.weaviate_client import WeaviateClient
-except ImportError:
-    # Expected failure - modules not implemented yet
-    TrendFetcher = None
-    TrendData = None
-    WeaviateClient = None
+    return TrendData
+
 
+@pytest.fixture(scope="module")
+def base_trend_kwargs():
+    """Canonical TrendData arguments; tests override only the field under test"""
+    return dict(
+        trend_topic="Test",
+        platform="twitter",
+        virality_score=0.5,
+        sentiment_score=0.0,
+        content_examples=[],
+        detected_at=_NOW
+    )
 
+
+@pytest.mark.xdist_group("schema")
 class TestTrendDataSchema:
     """
     Test TrendData entity against specs/technical.md schema definition
@@ -40,9 +101,7 @@ class TestTrendDataSchema:
     
     def test_trend_data_required_fields(self):
         """Assert TrendData contains all required fields from technical spec"""
-        # This test SHOULD FAIL - TrendData not implemented
-        assert TrendData is not None, "TrendData model not implemented"
-        
+        trend_data_model = _trend_data_model()
         # Required fields from specs/technical.md trend_data_schema
         required_fields = [
             'trend_topic',
@@ -54,30 +113,29 @@ class TestTrendDataSchema:
         ]
         
         # Create sample trend data
-        trend_instance = TrendData(
+        trend_instance = trend_data_model(
             trend_topic="AI Influencers",
             platform="twitter",
             virality_score=0.85,
             sentiment_score=0.72,
             content_examples=["Amazing AI content!", "Future is here"],
-            detected_at=datetime.utcnow()
+            detected_at=_NOW
         )
         
-        # Validate all required fields exist
-        for field in required_fields:
-            assert hasattr(trend_instance, field), f"Missing required field: {field}"
+        # Validate all required fields exist, reporting every missing one
+        missing = set(required_fields) - type(trend_instance).model_fields.keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
     
     def test_trend_data_field_types(self):
         """Validate TrendData field types match Weaviate schema"""
-        assert TrendData is not None, "TrendData model not implemented"
-        
-        trend_data = TrendData(
+        trend_data_model = _trend_data_model()
+        trend_data = trend_data_model(
             trend_topic="Test Topic",
             platform="instagram", 
             virality_score=0.9,
             sentiment_score=0.8,
             content_examples=["example1", "example2"],
-            detected_at=datetime.utcnow()
+            detected_at=_NOW
         )
         
         # Type validations from specs/technical.md
@@ -90,73 +148,119 @@ class TestTrendDataSchema:
         assert isinstance(trend_data.content_examples, list)
         assert isinstance(trend_data.detected_at, datetime)
     
-    def test_trend_data_platform_validation(self):
+    def test_trend_data_batch_validation(self):
+        """Validate score ranges across a batch of trends in one call"""
+        _trend_data_model()
+        from chimera.models.trend_data import validate_trend_scores
+        
+        # e.g. one Twitter API pull; returns the first invalid index or -1
+        viralities = [0.5] * 10_000
+        sentiments = [0.0] * 10_000
+        assert validate_trend_scores(viralities, sentiments) == -1
+        
+        # Same ranges as TrendData: virality 0..1, sentiment -1..1
+        sentiments[42] = -1.5
+        viralities[1234] = 1.5
+        assert validate_trend_scores(viralities, sentiments) == 42
+        sentiments[42] = 0.0
+        assert validate_trend_scores(viralities, sentiments) == 1234
+    
+    @pytest.mark.performance
+    def test_trend_data_batch_validation_speed(self):
+        """Batch validation of one API pull stays within 10ms"""
+        _trend_data_model()
+        from chimera.models.trend_data import validate_trend_scores
+        
+        viralities = [0.5] * 10_000
+        sentiments = [0.0] * 10_000
+        
+        start = time.perf_counter_ns()
+        validate_trend_scores(viralities, sentiments)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        if timing_enforced():
+            assert elapsed < 0.01, f"Batch validation took {elapsed}s, exceeds 10ms"
+    
+    def test_trend_data_batch_layout(self, base_trend_kwargs):
+        """Collections of trends are stored column-wise (one array per field)"""
+        trend_data_model = _trend_data_model()
+        import numpy as np
+        from chimera.models.trend_data import TrendDataBatch
+        
+        platforms = ["twitter", "instagram", "tiktok", "youtube_shorts"]
+        trends = [
+            trend_data_model(**{
+                **base_trend_kwargs,
+                "platform": platforms[i % 4],
+                "virality_score": i / 10_000
+            })
+            for i in range(10_000)
+        ]
+        
+        batch = TrendDataBatch.from_trends(trends)
+        
+        assert len(batch) == len(trends)
+        assert isinstance(batch.virality, np.ndarray)
+        assert isinstance(batch.sentiment, np.ndarray)
+        assert batch.virality.shape == (len(trends),)
+        assert batch.detected_at.dtype.kind == "M"
+        # 4 platforms encode into one byte each
+        assert batch.platforms.dtype == np.uint8
+        assert len(batch.topics) == len(trends)
+        
+        # Filtering by score is a single vectorised comparison
+        viral = np.flatnonzero(batch.virality > 0.8)
+        assert len(viral) == sum(trend.virality_score > 0.8 for trend in trends)
+    
+    @pytest.mark.parametrize("platform", ["twitter", "instagram", "tiktok", "youtube_shorts"])
+    def test_trend_data_platform_validation(self, base_trend_kwargs, platform):
         """Ensure platform field accepts only valid social platforms"""
-        assert TrendData is not None, "TrendData model not implemented"
-        
-        valid_platforms = ["twitter", "instagram", "tiktok", "youtube_shorts"]
-        
-        for platform in valid_platforms:
-            trend_data = TrendData(
-                trend_topic="Test",
-                platform=platform,
-                virality_score=0.5,
-                sentiment_score=0.0,
-                content_examples=[],
-                detected_at=datetime.utcnow()
-            )
-            assert trend_data.platform == platform
-        
-        # Invalid platform should raise validation error
-        with pytest.raises(ValueError):
-            TrendData(
-                trend_topic="Test",
-                platform="invalid_platform", 
-                virality_score=0.5,
-                sentiment_score=0.0,
-                content_examples=[],
-                detected_at=datetime.utcnow()
-            )
+        trend_data_model = _trend_data_model()
+        trend_data = trend_data_model(**{**base_trend_kwargs, "platform": platform})
+        assert trend_data.platform == platform
+    
+    @pytest.mark.parametrize("platform", ["invalid_platform", "", None, 123])
+    def test_trend_data_invalid_platform_rejected(self, base_trend_kwargs, platform):
+        """Invalid platform should raise validation error"""
+        trend_data_model = _trend_data_model()
+        # The error must name the offending field (pydantic lists its location)
+        with pytest.raises(ValueError, match="platform"):
+            trend_data_model(**{**base_trend_kwargs, "platform": platform})
 
 
+@pytest.mark.xdist_group("api")
 class TestTrendFetcherAPI:
     """
     Test TrendFetcher API contract against specs/technical.md
     """
     
-    @pytest.fixture
-    def trend_fetcher(self):
-        """Create TrendFetcher instance for testing"""
-        # This SHOULD FAIL - TrendFetcher not implemented
-        assert TrendFetcher is not None, "TrendFetcher not implemented"
-        return TrendFetcher()
+    @pytest_asyncio.fixture(scope="session")
+    async def shared_trend_fetcher(self):
+        """Create one TrendFetcher (and its HTTP pools) for the whole session"""
+        from chimera.market_intelligence.trend_fetcher import TrendFetcher
+        fetcher = TrendFetcher()
+        yield fetcher
+        await fetcher.aclose()
+    
+    @pytest_asyncio.fixture
+    async def trend_fetcher(self, shared_trend_fetcher):
+        """Shared TrendFetcher, reset to a clean state for each test"""
+        # reset_state() also drops in-flight (coalesced) requests per
+        # specs/technical.md, so no test awaits another test's call
+        await shared_trend_fetcher.reset_state()
+        return shared_trend_fetcher
     
-    @pytest.mark.asyncio
     async def test_analyze_market_trends_input_schema(self, trend_fetcher):
         """Validate analyze_market_trends accepts correct input parameters"""
         
-        # Input schema from specs/technical.md MCP_SKILLS section
-        valid_input = {
-            "keywords": ["AI", "influencer", "content"],
-            "platforms": ["twitter", "instagram"],
-            "time_range": "24h"
-        }
-        
-        # This should not raise validation errors
-        result = await trend_fetcher.analyze_market_trends(**valid_input)
+        # Input schema from specs/technical.md MCP_SKILLS section;
+        # this should not raise validation errors
+        result = await trend_fetcher.analyze_market_trends(**_INPUT_24H)
         assert result is not None
     
-    @pytest.mark.asyncio
     async def test_analyze_market_trends_output_schema(self, trend_fetcher):
         """Validate analyze_market_trends returns correct output structure"""
         
-        input_data = {
-            "keywords": ["test"],
-            "platforms": ["twitter"], 
-            "time_range": "1h"
-        }
-        
-        result = await trend_fetcher.analyze_market_trends(**input_data)
+        result = await trend_fetcher.analyze_market_trends(**_INPUT_1H)
         
         # Output schema from specs/technical.md
         required_output_fields = [
@@ -173,35 +277,69 @@ class TestTrendFetcherAPI:
         assert isinstance(result["sentiment_analysis"], dict)
         assert isinstance(result["recommended_actions"], list)
     
-    @pytest.mark.asyncio
+    async def test_batched_trend_analysis(self, trend_fetcher):
+        """Validate analyze_market_trends_batch answers several requests in one call"""
+        
+        # Batch contract from specs/technical.md MCP_SKILLS section
+        requests = [
+            {"keywords": [f"batch{i}"], "platforms": ["twitter"], "time_range": "1h"}
+            for i in range(1, 6)
+        ]
+        
+        results = await trend_fetcher.analyze_market_trends_batch(requests)
+        
+        # One result per request, in request order
+        assert isinstance(results, list)
+        assert len(results) == len(requests)
+        for request, result in zip(requests, results):
+            assert "trend_scores" in result
+            assert "confidence_score" in result
+            assert set(result["trend_scores"]) <= set(request["keywords"])
+    
+    async def test_duplicate_requests_coalesced(self, trend_fetcher, monkeypatch):
+        """Concurrent identical analyze_market_trends calls share one backend call"""
+        
+        backend_calls = 0
+        fetch_trends = trend_fetcher.fetch_platform_trends
+        
+        async def counting_fetch(*args, **kwargs):
+            nonlocal backend_calls
+            backend_calls += 1
+            # Yield so the second caller arrives while this one is pending
+            await asyncio.sleep(0)
+            return await fetch_trends(*args, **kwargs)
+        
+        monkeypatch.setattr(trend_fetcher, "fetch_platform_trends", counting_fetch)
+        
+        request = {"keywords": ["coalesce"], "platforms": ["twitter"], "time_range": "1h"}
+        first, second = await asyncio.gather(
+            trend_fetcher.analyze_market_trends(**request),
+            trend_fetcher.analyze_market_trends(**request)
+        )
+        
+        assert backend_calls == 1, f"Expected 1 backend call, got {backend_calls}"
+        assert first == second
+    
+    @pytest.mark.performance
     async def test_trend_fetcher_performance_requirements(self, trend_fetcher):
         """Ensure trend analysis meets performance specifications"""
         
         # Performance requirements from specs/_meta.md
-        start_time = datetime.utcnow()
+        start = time.perf_counter_ns()
         
-        result = await trend_fetcher.analyze_market_trends(
-            keywords=["performance", "test"],
-            platforms=["twitter"],
-            time_range="1h"
-        )
+        result = await trend_fetcher.analyze_market_trends(**_INPUT_PERFORMANCE)
         
-        end_time = datetime.utcnow()
-        execution_time = (end_time - start_time).total_seconds()
+        execution_time = (time.perf_counter_ns() - start) / 1e9
         
         # Must complete within 10 seconds per specs/_meta.md
-        assert execution_time < 10.0, f"Trend analysis took {execution_time}s, exceeds 10s limit"
+        if timing_enforced():
+            assert execution_time < 10.0, f"Trend analysis took {execution_time}s, exceeds 10s limit"
         assert result is not None
     
-    @pytest.mark.asyncio
     async def test_trend_fetcher_confidence_scoring(self, trend_fetcher):
         """Validate confidence scoring for HITL routing decisions"""
         
-        result = await trend_fetcher.analyze_market_trends(
-            keywords=["confidence", "test"],
-            platforms=["twitter"],
-            time_range="6h"
-        )
+        result = await trend_fetcher.analyze_market_trends(**_INPUT_CONFIDENCE)
         
         # Must include confidence score for HITL routing per specs/functional.md
         assert "confidence_score" in result
@@ -221,37 +359,43 @@ class TestTrendFetcherAPI:
             pass
 
 
+@pytest.mark.xdist_group("weaviate")
 class TestWeaviateIntegration:
     """
     Test Weaviate MCP server integration for trend data storage
     """
     
-    @pytest.fixture
-    def weaviate_client(self):
-        """Create WeaviateClient instance for testing"""
-        # This SHOULD FAIL - WeaviateClient not implemented
-        assert WeaviateClient is not None, "WeaviateClient not implemented"
-        return WeaviateClient()
+    @pytest_asyncio.fixture(scope="session")
+    async def shared_weaviate_client(self, weaviate_stub):
+        """Create one WeaviateClient connection for the whole session"""
+        from chimera.mcp_clients.weaviate_client import WeaviateClient
+        client = WeaviateClient()
+        yield client
+        await client.aclose()
+    
+    @pytest_asyncio.fixture
+    async def weaviate_client(self, shared_weaviate_client):
+        """Shared WeaviateClient, reset to a clean state for each test"""
+        await shared_weaviate_client.reset_state()
+        return shared_weaviate_client
     
-    @pytest.mark.asyncio
     async def test_weaviate_trend_storage(self, weaviate_client):
         """Test storing trend data in Weaviate vector database"""
         
-        trend_data = {
-            "trend_topic": "AI Testing",
-            "platform": "twitter",
-            "virality_score": 0.75,
-            "sentiment_score": 0.6,
-            "content_examples": ["Test content 1", "Test content 2"],
-            "detected_at": datetime.utcnow().isoformat()
-        }
+        trend_data = {**_TREND_RECORD, "detected_at": _NOW.isoformat()}
         
         # Store trend data
         result = await weaviate_client.store_trend_data(trend_data)
         assert result["success"] == True
         assert "object_id" in result
     
-    @pytest.mark.asyncio
+    async def test_weaviate_trend_storage_raw(self, weaviate_client):
+        """Test storing a pre-serialised trend payload without re-encoding"""
+        
+        result = await weaviate_client.store_trend_data_raw(_TREND_PAYLOAD)
+        assert result["success"] == True
+        assert "object_id" in result
+    
     async def test_weaviate_trend_query(self, weaviate_client):
         """Test querying trend data from Weaviate"""
         
@@ -265,13 +409,13 @@ class TestWeaviateIntegration:
         results = await weaviate_client.query_trends(**query_params)
         
         assert isinstance(results, list)
+        assert results, "Stubbed Weaviate returns one matching trend"
         # Each result should match TrendData schema
         for trend in results:
             assert "trend_topic" in trend
             assert "virality_score" in trend
             assert trend["virality_score"] >= query_params["min_virality_score"]
     
-    @pytest.mark.asyncio  
     async def test_weaviate_vector_search(self, weaviate_client):
         """Test semantic similarity search for trend discovery"""
         
@@ -284,7 +428,7 @@ class TestWeaviateIntegration:
         )
         
         assert isinstance(results, list)
-        assert len(results) <= 10
+        assert 0 < len(results) <= 10
         
         # Each result should include certainty score
         for result in results:
@@ -320,18 +464,21 @@ class TestTrendDataEndpoints:
 
 
 # Performance and Load Testing 
+@pytest.mark.xdist_group("perf")
 class TestTrendFetcherPerformance:
     """
     Performance tests ensuring system scalability requirements
     """
     
-    @pytest.mark.asyncio
+    @pytest.mark.performance
     async def test_concurrent_trend_analysis(self):
         """Test handling multiple concurrent trend analysis requests"""
         
-        if TrendFetcher is None:
+        if not _HAS_TREND:
             pytest.skip("TrendFetcher not implemented")
         
+        from chimera.market_intelligence.trend_fetcher import TrendFetcher
+        
         # Simulate multiple agents requesting trend analysis simultaneously
         fetcher = TrendFetcher()
         
@@ -343,17 +490,13 @@ class TestTrendFetcherPerformance:
             )
         
         # Test concurrent execution
-        tasks = [
-            analyze_trends(["test1"]),
-            analyze_trends(["test2"]), 
-            analyze_trends(["test3"]),
-            analyze_trends(["test4"]),
-            analyze_trends(["test5"])
-        ]
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(analyze_trends([f"test{i}"])) for i in range(1, 6)]
+        end_time = loop.time()
         
-        start_time = datetime.utcnow()
-        results = await asyncio.gather(*tasks)
-        end_time = datetime.utcnow()
+        results = [task.result() for task in tasks]
         
         # All requests should complete successfully
         assert len(results) == 5
@@ -362,8 +505,9 @@ class TestTrendFetcherPerformance:
             assert "confidence_score" in result
         
         # Total time should be reasonable for concurrent execution
-        total_time = (end_time - start_time).total_seconds()
-        assert total_time < 15.0, f"Concurrent analysis took {total_time}s, too slow"
+        total_time = end_time - start_time
+        if timing_enforced():
+            assert total_time < 15.0, f"Concurrent analysis took {total_time}s, too slow"
 
 
 # Integration Test with Skills System
@@ -373,7 +517,6 @@ class TestTrendSpecIntegration:
     Integration tests validating trend fetcher works with Skills architecture
     """
     
-    @pytest.mark.asyncio
     async def test_skill_analyze_trends_integration(self):
         """Test integration between TrendFetcher and skill_analyze_trends"""
         